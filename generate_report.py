@@ -1,42 +1,65 @@
+from __future__ import annotations
+
+import functools
+import io
 import os
+import re
 import sys
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
+from reportlab.lib.utils import simpleSplit
 from reportlab.platypus import (
-    SimpleDocTemplate,
     Paragraph,
     Spacer,
     Table,
     TableStyle,
-    Image,
     PageBreak,
     Flowable,
+    KeepTogether,
 )
+from reportlab.platypus.doctemplate import LayoutError
 
 
 # =============================
 # Configuration & Design System
 # =============================
 
-PRIMARY_BLUE = colors.HexColor("#2E86AB")
-SECONDARY_PURPLE = colors.HexColor("#A23B72")
-ACCENT_ORANGE = colors.HexColor("#F18F01")
-NEUTRAL_DARK = colors.HexColor("#2D2D2D")
-NEUTRAL_TEXT = colors.HexColor("#3A3A3A")
-NEUTRAL_MUTED = colors.HexColor("#6F6F6F")
-NEUTRAL_BORDER = colors.HexColor("#DDDDDD")
-NEUTRAL_BG = colors.HexColor("#F7F9FB")
+# Built directly from RGB components (same values as HexColor, without parsing strings)
+PRIMARY_BLUE = colors.Color(0x2E / 255, 0x86 / 255, 0xAB / 255)  # #2E86AB
+SECONDARY_PURPLE = colors.Color(0xA2 / 255, 0x3B / 255, 0x72 / 255)  # #A23B72
+ACCENT_ORANGE = colors.Color(0xF1 / 255, 0x8F / 255, 0x01 / 255)  # #F18F01
+NEUTRAL_DARK = colors.Color(0x2D / 255, 0x2D / 255, 0x2D / 255)  # #2D2D2D
+NEUTRAL_TEXT = colors.Color(0x3A / 255, 0x3A / 255, 0x3A / 255)  # #3A3A3A
+NEUTRAL_MUTED = colors.Color(0x6F / 255, 0x6F / 255, 0x6F / 255)  # #6F6F6F
+NEUTRAL_BORDER = colors.Color(0xDD / 255, 0xDD / 255, 0xDD / 255)  # #DDDDDD
+NEUTRAL_BG = colors.Color(0xF7 / 255, 0xF9 / 255, 0xFB / 255)  # #F7F9FB
+
+# Alternating body-row backgrounds shared by every table (see BandedTable)
+_ROW_BGS = (colors.white, colors.whitesmoke)
+
+FONT_REGULAR = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+FONT_ITALIC = "Helvetica-Oblique"
 
 PAGE_SIZE = A4
 MARGIN = 72  # 72pt margins per requirement
+DIVIDER_WIDTH = PAGE_SIZE[0] - 2 * MARGIN
 
 # Target screenshot size: 6.5in x 4in (468 x 288 pt)
 SHOT_W = 6.5 * inch
 SHOT_H = 4.0 * inch
+# Pixel size screenshots are embedded at (2x the drawn size)
+SHOT_PX = (int(SHOT_W * 2), int(SHOT_H * 2))
+SHOT_JPEG_QUALITY = 82
+
+SCREENSHOTS_DIR = "screenshots"
+# Re-encoded screenshots live here, keyed by source mtime/size and encoding settings
+CACHE_DIR = ".cache"
 
 
 def repo_basename() -> str:
@@ -53,13 +76,45 @@ OUTPUT_PDF = f"{repo_basename()}_Modern_Report.pdf"
 # Styles
 # =============================
 
+@dataclass(frozen=True, slots=True)
+class Styles:
+    title: ParagraphStyle
+    subtitle: ParagraphStyle
+    h2: ParagraphStyle
+    h2c: ParagraphStyle
+    body: ParagraphStyle
+    caption: ParagraphStyle
+    small: ParagraphStyle
+    th: ParagraphStyle
+    tc: ParagraphStyle
+    callout: ParagraphStyle
+    notice: ParagraphStyle
+
+
+_FONTS_READY = False
+
+
+def ensure_fonts():
+    # Resolve the standard fonts once up front; later lookups hit pdfmetrics' font cache
+    global _FONTS_READY
+    if _FONTS_READY:
+        return
+    from reportlab.pdfbase import pdfmetrics
+
+    for name in (FONT_REGULAR, FONT_BOLD, FONT_ITALIC):
+        pdfmetrics.getFont(name)
+    _FONTS_READY = True
+
+
+@functools.lru_cache(maxsize=1)
 def build_styles():
+    ensure_fonts()
     ss = getSampleStyleSheet()
 
     title = ParagraphStyle(
         name="Title",
         parent=ss["Title"],
-        fontName="Helvetica-Bold",
+        fontName=FONT_BOLD,
         fontSize=28,
         textColor=PRIMARY_BLUE,
         leading=34,
@@ -69,7 +124,7 @@ def build_styles():
     subtitle = ParagraphStyle(
         name="Subtitle",
         parent=ss["Normal"],
-        fontName="Helvetica",
+        fontName=FONT_REGULAR,
         fontSize=12,
         textColor=NEUTRAL_MUTED,
         leading=16,
@@ -79,7 +134,7 @@ def build_styles():
     h2 = ParagraphStyle(
         name="H2",
         parent=ss["Heading2"],
-        fontName="Helvetica-Bold",
+        fontName=FONT_BOLD,
         fontSize=18,
         textColor=NEUTRAL_DARK,
         leading=22,
@@ -96,7 +151,7 @@ def build_styles():
     body = ParagraphStyle(
         name="Body",
         parent=ss["BodyText"],
-        fontName="Helvetica",
+        fontName=FONT_REGULAR,
         fontSize=10.5,
         textColor=NEUTRAL_TEXT,
         leading=16,
@@ -106,7 +161,7 @@ def build_styles():
     caption = ParagraphStyle(
         name="Caption",
         parent=ss["Italic"],
-        fontName="Helvetica-Oblique",
+        fontName=FONT_ITALIC,
         fontSize=9,
         textColor=NEUTRAL_MUTED,
         leading=12,
@@ -118,7 +173,7 @@ def build_styles():
     small = ParagraphStyle(
         name="Small",
         parent=ss["Normal"],
-        fontName="Helvetica",
+        fontName=FONT_REGULAR,
         fontSize=9,
         textColor=NEUTRAL_MUTED,
         leading=12,
@@ -128,7 +183,7 @@ def build_styles():
     table_header = ParagraphStyle(
         name="TableHeader",
         parent=ss["Normal"],
-        fontName="Helvetica-Bold",
+        fontName=FONT_BOLD,
         fontSize=10,
         textColor=colors.white,
         leading=14,
@@ -137,7 +192,7 @@ def build_styles():
     table_cell = ParagraphStyle(
         name="TableCell",
         parent=ss["Normal"],
-        fontName="Helvetica",
+        fontName=FONT_REGULAR,
         fontSize=10,
         textColor=NEUTRAL_TEXT,
         leading=14,
@@ -146,7 +201,7 @@ def build_styles():
     callout = ParagraphStyle(
         name="Callout",
         parent=ss["Normal"],
-        fontName="Helvetica",
+        fontName=FONT_REGULAR,
         fontSize=10.5,
         textColor=NEUTRAL_DARK,
         backColor=NEUTRAL_BG,
@@ -158,114 +213,339 @@ def build_styles():
         borderPadding=8,
     )
 
-    return {
-        "title": title,
-        "subtitle": subtitle,
-        "h2": h2,
-        "h2c": h2_color,
-        "body": body,
-        "caption": caption,
-        "small": small,
-        "th": table_header,
-        "tc": table_cell,
-        "callout": callout,
-    }
+    return Styles(
+        title=title,
+        subtitle=subtitle,
+        h2=h2,
+        h2c=h2_color,
+        body=body,
+        caption=caption,
+        small=small,
+        th=table_header,
+        tc=table_cell,
+        callout=callout,
+        # Shared by the "Missing" / "Err" placeholders in screenshot_flowable
+        notice=ParagraphStyle(name="Notice", parent=table_cell, textColor=ACCENT_ORANGE),
+    )
+
+
+# Status column text colors; anything unrecognised is flagged in orange
+_STATUS_COLORS = {
+    "Done": PRIMARY_BLUE,
+    "In Progress": SECONDARY_PURPLE,
+    "_default": ACCENT_ORANGE,
+}
 
 
 # =============================
 # Helpers / Components
 # =============================
 
+CELL_FONT_SIZE = 10
+CELL_LEADING = 14
+CELL_PAD = 8
+CELL_VPAD = 6
+
+
 class Divider(Flowable):
     def __init__(self, width=1, color=NEUTRAL_BORDER):
         super().__init__()
         self.width = width
         self.color = color
+        self._w = DIVIDER_WIDTH
 
     def draw(self):
         self.canv.setStrokeColor(self.color)
         self.canv.setLineWidth(self.width)
-        w = self.canv._pagesize[0] - 2 * MARGIN
-        self.canv.line(0, 0, w, 0)
+        self.canv.line(0, 0, self._w, 0)
+
+
+class Screenshot(Flowable):
+    def __init__(self, reader, width=SHOT_W, height=SHOT_H):
+        super().__init__()
+        self.reader = reader
+        self.width = width
+        self.height = height
+        self.hAlign = "CENTER"
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.width, self.height, mask="auto")
+
+
+class BandedTable(Table):
+    # Zebra stripes below the header row, painted as one filled path per color
+    # before the table draws, instead of a ROWBACKGROUNDS rect per row
+    band_colors = _ROW_BGS
+    header_rows = 1  # rows above the stripes
+    band_phase = 0  # body rows before this piece when the table was split
+
+    def _splitRows(self, availHeight, doInRowSplit=0):
+        # Pieces are new instances: carry the header and stripe phase over, as
+        # ROWBACKGROUNDS does on split, so a continuation keeps alternating
+        pieces = super()._splitRows(availHeight, doInRowSplit)
+        if len(pieces) == 2:
+            head, rest = pieces
+            head.header_rows, head.band_phase = self.header_rows, self.band_phase
+            rest.header_rows = rest.repeatRows or 0
+            rest.band_phase = self.band_phase + len(head._cellvalues) - self.header_rows
+        return pieces
 
+    def draw(self):
+        canv = self.canv
+        rows = self._rowpositions  # top-down row edges (prefix sums of _rowHeights)
+        x0 = self._colpositions[0]
+        width = self._colpositions[-1] - x0
+        n = len(self.band_colors)
+        first = self.header_rows
+        canv.saveState()
+        for offset, color in enumerate(self.band_colors):
+            if color == colors.white:
+                continue  # already the page color
+            path = canv.beginPath()
+            start = first + (offset - self.band_phase) % n
+            for row in range(start, len(rows) - 1, n):
+                path.rect(x0, rows[row + 1], width, rows[row] - rows[row + 1])
+            canv.setFillColor(color)
+            canv.drawPath(path, stroke=0, fill=1)
+        canv.restoreState()
+        super().draw()
+
+
+class CoverTable(Flowable):
+    # The cover's Field/Details table has a fixed shape, so it is drawn directly
+    # with canvas calls in the colored_table look instead of going through Table.
+    # Values that are URLs are drawn in the accent color and linked.
+    # Always two columns: a field name and its value.
+    def __init__(self, rows, col_widths, header=("Field", "Details"), header_bg=PRIMARY_BLUE):
+        super().__init__()
+        if len(col_widths) != 2 or len(header) != 2 or any(len(row) != 2 for row in rows):
+            raise ValueError("CoverTable takes exactly two columns (field, value)")
+        self.col_widths = col_widths
+        self.header_bg = header_bg
+        self.hAlign = "LEFT"
+        # Measure with the font each row is drawn in: bold header, regular body
+        self.cells = [
+            [simpleSplit(text, font, CELL_FONT_SIZE, w - 2 * CELL_PAD) for text, w in zip(row, col_widths)]
+            for row, font in zip([header, *rows], [FONT_BOLD] + [FONT_REGULAR] * len(rows))
+        ]
+        self.links = [None] + [
+            value if value.startswith(("http://", "https://")) else None for _, value in rows
+        ]
+        self.row_heights = [max(len(lines) for lines in row) * CELL_LEADING + 2 * CELL_VPAD for row in self.cells]
+        self.width = sum(col_widths)
+        self.height = sum(self.row_heights)
 
-def section_header(text: str, styles, accent=PRIMARY_BLUE):
+    def draw(self):
+        canv = self.canv
+        col_x = [0]
+        for w in self.col_widths:
+            col_x.append(col_x[-1] + w)
+        row_y = [self.height]
+        for h in self.row_heights:
+            row_y.append(row_y[-1] - h)
+
+        # Backgrounds: header band, then zebra body rows
+        for row, h in enumerate(self.row_heights):
+            bg = self.header_bg if row == 0 else _ROW_BGS[(row - 1) % len(_ROW_BGS)]
+            if bg != colors.white:
+                canv.setFillColor(bg)
+                canv.rect(0, row_y[row + 1], self.width, h, stroke=0, fill=1)
+
+        # Text, vertically centred like Table's VALIGN MIDDLE
+        for row, (cells, h, url) in enumerate(zip(self.cells, self.row_heights, self.links)):
+            canv.setFont(FONT_BOLD if row == 0 else FONT_REGULAR, CELL_FONT_SIZE, CELL_LEADING)
+            for col, lines in enumerate(cells):
+                color = colors.white if row == 0 else PRIMARY_BLUE if url and col == 1 else NEUTRAL_TEXT
+                canv.setFillColor(color)
+                x = col_x[col] + CELL_PAD
+                y = row_y[row + 1] + (h + len(lines) * CELL_LEADING) / 2 - CELL_FONT_SIZE
+                for line in lines:
+                    canv.drawString(x, y, line)
+                    y -= CELL_LEADING
+            if url:
+                canv.linkURL(url, (col_x[1], row_y[row + 1], col_x[2], row_y[row]), relative=1)
+
+        # Header rules, then the grid
+        canv.setStrokeColor(self.header_bg)
+        canv.setLineWidth(1)
+        canv.line(0, row_y[0], self.width, row_y[0])
+        canv.line(0, row_y[1], self.width, row_y[1])
+        canv.setStrokeColor(NEUTRAL_BORDER)
+        canv.setLineWidth(0.5)
+        for y in row_y:
+            canv.line(0, y, self.width, y)
+        for x in col_x:
+            canv.line(x, 0, x, self.height)
+
+
+def section_header(text: str, accent=PRIMARY_BLUE):
     # Emoji included per requirement; note some PDF viewers may not render emoji with Helvetica
-    return [
+    # Built per call so each story owns its flowables; kept together so it never splits across pages.
+    return [KeepTogether([
         Spacer(1, 10),
-        Paragraph(text, styles["h2c"]),
+        Paragraph(text, build_styles().h2c),
         Spacer(1, 4),
         Divider(width=1.2, color=accent),
         Spacer(1, 8),
-    ]
+    ])]
+
 
+def table_cell(text, col_width, font=FONT_REGULAR):
+    # Plain text is pre-split and drawn by the Table itself, no Paragraph needed.
+    # font must match the cell's FONT command so lines are measured as drawn.
+    return "\n".join(simpleSplit(text, font, CELL_FONT_SIZE, col_width - 2 * CELL_PAD))
 
-def colored_table(data, colWidths=None, header_bg=PRIMARY_BLUE, grid_color=NEUTRAL_BORDER):
-    # data: first row is header (Paragraphs already styled)
-    t = Table(data, colWidths=colWidths, hAlign="LEFT")
+
+def colored_table(data, colWidths=None, header_bg=PRIMARY_BLUE, grid_color=NEUTRAL_BORDER, extra_cmds=()):
+    # data: first row is header; plain-string cells are styled via FONT/TEXTCOLOR commands
+    t = BandedTable(data, colWidths=colWidths, hAlign="LEFT")
     style_cmds = [
         ("BACKGROUND", (0, 0), (-1, 0), header_bg),
         ("LINEABOVE", (0, 0), (-1, 0), 1, header_bg),
         ("LINEBELOW", (0, 0), (-1, 0), 1, header_bg),
+        ("FONT", (0, 0), (-1, 0), FONT_BOLD, CELL_FONT_SIZE, CELL_LEADING),
         ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONT", (0, 1), (-1, -1), FONT_REGULAR, CELL_FONT_SIZE, CELL_LEADING),
+        ("TEXTCOLOR", (0, 1), (-1, -1), NEUTRAL_TEXT),
         ("ALIGN", (0, 0), (-1, 0), "LEFT"),
         ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
         ("GRID", (0, 0), (-1, -1), 0.5, grid_color),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
-        ("LEFTPADDING", (0, 0), (-1, -1), 8),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-        ("TOPPADDING", (0, 0), (-1, -1), 6),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ("LEFTPADDING", (0, 0), (-1, -1), CELL_PAD),
+        ("RIGHTPADDING", (0, 0), (-1, -1), CELL_PAD),
+        ("TOPPADDING", (0, 0), (-1, -1), CELL_VPAD),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), CELL_VPAD),
     ]
+    style_cmds.extend(extra_cmds)
     t.setStyle(TableStyle(style_cmds))
     return t
 
 
-def info_table(rows, styles):
-    data = [
-        [Paragraph("Field", styles["th"]), Paragraph("Details", styles["th"])],
-    ]
-    for k, v in rows:
-        data.append([Paragraph(k, styles["tc"]), Paragraph(v, styles["tc"])])
-    return colored_table(data, colWidths=[1.7 * inch, 4.6 * inch])
+def info_table(rows):
+    return CoverTable(rows, col_widths=(1.7 * inch, 4.6 * inch))
 
 
-def deliverables_table(items, styles):
-    data = [
-        [Paragraph("Deliverable", styles["th"]), Paragraph("Status", styles["th"])],
-    ]
-    for text, status in items:
-        color = SECONDARY_PURPLE if status == "In Progress" else PRIMARY_BLUE if status == "Done" else ACCENT_ORANGE
-        data.append([
-            Paragraph(text, styles["tc"]),
-            Paragraph(f"{status}", ParagraphStyle(name="Status", parent=styles["tc"], textColor=color, fontName="Helvetica-Bold")),
-        ])
-    return colored_table(data, colWidths=[4.5 * inch, 1.8 * inch], header_bg=SECONDARY_PURPLE)
-
-
-def success_metrics_table(metrics, styles):
-    data = [
-        [Paragraph("Metric", styles["th"]), Paragraph("Value", styles["th"]), Paragraph("Notes", styles["th"])],
-    ]
+def deliverables_table(items):
+    col_widths = [4.5 * inch, 1.8 * inch]
+    data = [["Deliverable", "Status"]]
+    # The status column is bold throughout; only its color varies per row
+    status_cmds = [("FONT", (1, 1), (1, -1), FONT_BOLD, CELL_FONT_SIZE, CELL_LEADING)]
+    for row, (text, status) in enumerate(items, start=1):
+        data.append([table_cell(text, col_widths[0]), table_cell(status, col_widths[1], font=FONT_BOLD)])
+        status_color = _STATUS_COLORS.get(status, _STATUS_COLORS["_default"])
+        status_cmds.append(("TEXTCOLOR", (1, row), (1, row), status_color))
+    return colored_table(data, colWidths=col_widths, header_bg=SECONDARY_PURPLE, extra_cmds=status_cmds)
+
+
+def success_metrics_table(metrics):
+    col_widths = [2.2 * inch, 1.6 * inch, 2.5 * inch]
+    data = [["Metric", "Value", "Notes"]]
     for m, v, n in metrics:
-        data.append([Paragraph(m, styles["tc"]), Paragraph(v, styles["tc"]), Paragraph(n, styles["tc"])])
-    return colored_table(data, colWidths=[2.2 * inch, 1.6 * inch, 2.5 * inch], header_bg=PRIMARY_BLUE)
+        data.append([table_cell(cell, w) for cell, w in zip((m, v, n), col_widths)])
+    return colored_table(data, colWidths=col_widths, header_bg=PRIMARY_BLUE)
+
+
+def _prepare_screenshot(path):
+    """Return a JPEG of ``path`` sized for embedding, re-encoding only when the source changes."""
+    if os.path.splitext(path)[1].lower() in (".jpg", ".jpeg"):
+        return path
+
+    st = os.stat(path)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    # Encoding settings are part of the key so changing them re-encodes
+    settings = f"{SHOT_PX[0]}x{SHOT_PX[1]}-q{SHOT_JPEG_QUALITY}"
+    cached_name = f"{stem}-{st.st_mtime_ns}-{st.st_size}-{settings}.jpg"
+    cached_path = os.path.join(CACHE_DIR, cached_name)
+    if os.path.exists(cached_path):
+        return cached_path
+
+    from PIL import Image as PILImage
+
+    with PILImage.open(path) as im:
+        if im.mode in ("RGBA", "LA", "P"):
+            # Flatten onto white; ReportLab would otherwise embed a separate soft mask
+            im = im.convert("RGBA")
+            flat = PILImage.new("RGB", im.size, "white")
+            flat.paste(im, mask=im.getchannel("A"))
+            im = flat
+        else:
+            im = im.convert("RGB")
+        if im.width > SHOT_PX[0] or im.height > SHOT_PX[1]:
+            im = im.resize(SHOT_PX, PILImage.LANCZOS)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cached_path}.{os.getpid()}.tmp"
+        im.save(tmp_path, "JPEG", quality=SHOT_JPEG_QUALITY, optimize=True, progressive=True)
+    os.replace(tmp_path, cached_path)
+    _prune_cache(stem, keep=cached_name)
+    return cached_path
+
+
+def _prune_cache(stem, keep):
+    # Drop earlier encodings of the same screenshot (older source or settings)
+    # Match the full name pattern so "s3" does not also prune "s3-settings"
+    pattern = re.compile(rf"{re.escape(stem)}-\d+-\d+(-\d+x\d+-q\d+)?\.jpg")
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            if entry.name != keep and pattern.fullmatch(entry.name):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+def prepare_screenshots(paths):
+    """Prepare screenshots concurrently; returns {source path: prepared path or exception}.
+
+    Pillow releases the GIL while decoding and encoding, so threads overlap well.
+    A path that fails maps to the exception it raised, which screenshot_flowable reports.
+    """
+    prepared = {}
+    if not paths:
+        return prepared
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+        futures = {pool.submit(_prepare_screenshot, path): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                prepared[futures[future]] = future.result()
+            except Exception as e:
+                prepared[futures[future]] = e
+    return prepared
+
+
+@functools.lru_cache(maxsize=None)
+def _reader(prepared_path):
+    # One reader per screenshot; JPEG data is embedded as-is, without a zlib round-trip
+    from reportlab.lib.utils import ImageReader
+
+    return ImageReader(prepared_path)
+
+
+def existing_files(directory) -> frozenset[str]:
+    # One directory listing instead of a stat() per file
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        return frozenset()
 
 
-def screenshot_flowable(path, caption, styles):
+def screenshot_flowable(path, caption, styles, present, prepared=None):
+    # present: file names found in the screenshot's directory (see existing_files)
+    # prepared: this path's entry from prepare_screenshots (prepared path or the exception raised)
     items = []
-    if not os.path.exists(path):
-        items.append(Paragraph(f"[Missing screenshot: {os.path.basename(path)}]", ParagraphStyle(name="Missing", parent=styles["tc"], textColor=ACCENT_ORANGE)))
+    if os.path.basename(path) not in present:
+        items.append(Paragraph(f"[Missing screenshot: {os.path.basename(path)}]", styles.notice))
         return items
 
     # Ensure width matches 6.5in; allow slight overflow beyond frame by using an Indenter-like trick via negative space
     try:
-        img = Image(path, width=SHOT_W, height=SHOT_H)
-        img.hAlign = "CENTER"
-        items.append(img)
-        items.append(Paragraph(caption, styles["caption"]))
+        if isinstance(prepared, Exception):
+            raise prepared
+        items.append(Screenshot(_reader(prepared or _prepare_screenshot(path))))
+        items.append(Paragraph(caption, styles.caption))
     except Exception as e:
-        items.append(Paragraph(f"[Error loading {os.path.basename(path)}: {e}]", ParagraphStyle(name="Err", parent=styles["tc"], textColor=ACCENT_ORANGE)))
+        items.append(Paragraph(f"[Error loading {os.path.basename(path)}: {e}]", styles.notice))
     return items
 
 
@@ -280,7 +560,18 @@ PROJECT_SUBTITLE = "Infrastructure-as-Code with Terraform for a globally distrib
 LIVE_URL = "https://dbnp3womfvfzi.cloudfront.net"
 AUTHOR = "thaboxan"
 REPO = repo_basename()
-TODAY = datetime.now().strftime("%B %d, %Y")
+
+# English month names, so the cover date does not depend on the process locale
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def format_date(d: date) -> str:
+    # e.g. "October 05, 2026", matching strftime("%B %d, %Y")
+    return f"{_MONTHS[d.month - 1]} {d.day:02d}, {d.year}"
+
 
 ORIGINAL_TASK_DESCRIPTION = (
     "Deploy a production-ready static website on AWS using S3 for website hosting and CloudFront for global content delivery. "
@@ -289,42 +580,43 @@ ORIGINAL_TASK_DESCRIPTION = (
 )
 
 
-def build_story():
+def build_story(today: date | None = None):
     styles = build_styles()
+    today = today or date.today()
     story = []
 
     # Cover Page
-    story.append(Paragraph(PROJECT_TITLE, styles["title"]))
-    story.append(Paragraph(PROJECT_SUBTITLE, styles["subtitle"]))
+    story.append(Paragraph(PROJECT_TITLE, styles.title))
+    story.append(Paragraph(PROJECT_SUBTITLE, styles.subtitle))
 
     # Info table
     info_rows = [
         ("Project", PROJECT_TITLE),
         ("Repository", REPO),
         ("Author", AUTHOR),
-        ("Date", TODAY),
-        ("Live URL", f"<link href='{LIVE_URL}' color='{PRIMARY_BLUE}'>" + LIVE_URL + "</link>"),
+        ("Date", format_date(today)),
+        ("Live URL", LIVE_URL),
         ("Stack", "AWS S3, AWS CloudFront, Terraform, HTML/CSS, AWS CLI"),
     ]
     story.append(Spacer(1, 12))
-    story.append(info_table(info_rows, styles))
+    story.append(info_table(info_rows))
     story.append(Spacer(1, 18))
-    story.append(Paragraph("Corporate-ready PDF generated via Python ReportLab with modern styling.", styles["small"]))
+    story.append(Paragraph("Corporate-ready PDF generated via Python ReportLab with modern styling.", styles.small))
     story.append(PageBreak())
 
     # Executive Summary
-    story += section_header("📄 Executive Summary", styles, accent=PRIMARY_BLUE)
+    story += section_header("📄 Executive Summary", accent=PRIMARY_BLUE)
     summary_text = (
         "This engagement delivers a robust, cost-effective static website platform on AWS. The site is hosted in Amazon S3 "
         "and distributed globally via Amazon CloudFront. Terraform codifies the infrastructure for consistency and repeatability. "
         "Security follows best practices with CloudFront as the single entry point and S3 protected by Origin Access Control."
     )
-    story.append(Paragraph(summary_text, styles["body"]))
+    story.append(Paragraph(summary_text, styles.body))
 
     # Requirements
-    story += section_header("📋 Requirements", styles, accent=SECONDARY_PURPLE)
-    story.append(Paragraph("Original Task Description", styles["h2"]))
-    story.append(Paragraph(ORIGINAL_TASK_DESCRIPTION, styles["callout"]))
+    story += section_header("📋 Requirements", accent=SECONDARY_PURPLE)
+    story.append(Paragraph("Original Task Description", styles.h2))
+    story.append(Paragraph(ORIGINAL_TASK_DESCRIPTION, styles.callout))
 
     deliverables = [
         ("Terraform IaC for S3 + CloudFront (OAC, default root object, HTTPS)", "Done"),
@@ -334,11 +626,11 @@ def build_story():
         ("Documentation (README, PDF report)", "Done"),
     ]
     story.append(Spacer(1, 6))
-    story.append(deliverables_table(deliverables, styles))
+    story.append(deliverables_table(deliverables))
     story.append(PageBreak())
 
     # Implementation Details
-    story += section_header("🧩 Implementation Details", styles, accent=PRIMARY_BLUE)
+    story += section_header("🧩 Implementation Details", accent=PRIMARY_BLUE)
     impl_points = [
         "Provisioned AWS resources via Terraform: S3 bucket with versioning, CloudFront distribution, and Origin Access Control.",
         "Restricted bucket access to CloudFront using OAC; public website access flows exclusively through CloudFront.",
@@ -347,37 +639,36 @@ def build_story():
         "Performed deployment validation and recorded evidence screenshots.",
     ]
     for p in impl_points:
-        story.append(Paragraph(f"• {p}", styles["body"]))
+        story.append(Paragraph(f"• {p}", styles.body))
 
     story.append(Spacer(1, 10))
 
     # Testing and Verification with Screenshots
-    story += section_header("🧪 Testing & Verification", styles, accent=SECONDARY_PURPLE)
+    story += section_header("🧪 Testing & Verification", accent=SECONDARY_PURPLE)
 
     screenshots = [
-        (os.path.join("screenshots", "s3-settings.png"), "S3 bucket configuration and static website settings."),
-        (os.path.join("screenshots", "bucket-policy.png"), "Bucket policy allowing least-privilege access for website content."),
-        (os.path.join("screenshots", "cloudfront-distribution.png"), "CloudFront distribution settings with OAC and default behavior."),
-        (os.path.join("screenshots", "website-live.png"), "Live website served via CloudFront global edge locations."),
-        (os.path.join("screenshots", "week_8.png"), "Deployment summary overview of resources and outcomes."),
+        (os.path.join(SCREENSHOTS_DIR, "s3-settings.png"), "S3 bucket configuration and static website settings."),
+        (os.path.join(SCREENSHOTS_DIR, "bucket-policy.png"), "Bucket policy allowing least-privilege access for website content."),
+        (os.path.join(SCREENSHOTS_DIR, "cloudfront-distribution.png"), "CloudFront distribution settings with OAC and default behavior."),
+        (os.path.join(SCREENSHOTS_DIR, "website-live.png"), "Live website served via CloudFront global edge locations."),
+        (os.path.join(SCREENSHOTS_DIR, "week_8.png"), "Deployment summary overview of resources and outcomes."),
     ]
 
-    missing = []
+    screenshots_present = existing_files(SCREENSHOTS_DIR)
+    prepared = prepare_screenshots([pth for pth, _ in screenshots if os.path.basename(pth) in screenshots_present])
     for pth, cap in screenshots:
-        if not os.path.exists(pth):
-            missing.append(os.path.basename(pth))
-        story += screenshot_flowable(pth, cap, styles)
+        story += screenshot_flowable(pth, cap, styles, screenshots_present, prepared.get(pth))
         story.append(Spacer(1, 16))
 
     story.append(PageBreak())
 
     # Conclusion
-    story += section_header("🏁 Conclusion", styles, accent=PRIMARY_BLUE)
+    story += section_header("🏁 Conclusion", accent=PRIMARY_BLUE)
     conclusion_text = (
         "The solution meets all stated objectives: it is globally performant, secure by design, automated via Terraform, "
         "and documented. The platform is production-ready and positioned for low operational overhead and cost efficiency."
     )
-    story.append(Paragraph(conclusion_text, styles["body"]))
+    story.append(Paragraph(conclusion_text, styles.body))
 
     metrics = [
         ("Provisioning Time", "~15 minutes", "Includes CloudFront deployment propagation."),
@@ -385,25 +676,102 @@ def build_story():
         ("Security Posture", "OAC-enabled", "Direct S3 access restricted; HTTPS enforced."),
         ("Scalability", "Global CDN", "Auto-scales via CloudFront edge network."),
     ]
-    story.append(success_metrics_table(metrics, styles))
+    story.append(success_metrics_table(metrics))
 
     story.append(Spacer(1, 18))
-    story.append(Paragraph("Technical Summary", styles["h2"]))
+    story.append(Paragraph("Technical Summary", styles.h2))
     story.append(
         Paragraph(
             "S3 provides durable object storage and static website hosting; CloudFront delivers content with low latency. "
             "Terraform codifies the infrastructure, enabling reproducible deployments and change control.",
-            styles["body"],
+            styles.body,
         )
     )
 
     return story
 
 
-def build_pdf(output_path: str) -> int:
-    try:
+# Matches the default 6pt padding of the Frame SimpleDocTemplate lays out into
+FRAME_PAD = 6
+
+
+def draw_story(canv, story):
+    """Draw a hand-paginated story straight onto ``canv`` in a single pass.
+
+    The report only breaks pages explicitly, so flowables are wrapped and drawn
+    one after another. One that does not fit is split at the page bottom when it
+    can be (tables, paragraphs) and otherwise moves to the next page; a
+    KeepTogether group moves as a whole. Anything taller than a full page that
+    cannot be split raises LayoutError rather than being clipped.
+    """
+    page_w, page_h = PAGE_SIZE
+    x = MARGIN + FRAME_PAD
+    avail_w = page_w - 2 * (MARGIN + FRAME_PAD)
+    top = page_h - MARGIN - FRAME_PAD
+    bottom = MARGIN + FRAME_PAD
+    y = top
+    space_after = 0
+    for flowable in story:
+        if isinstance(flowable, PageBreak):
+            canv.showPage()
+            y, space_after = top, 0
+            continue
+        parts = [flowable]
+        if isinstance(flowable, KeepTogether):
+            parts = flowable._content
+            needed = sum(
+                p.getSpaceBefore() + p.wrapOn(canv, avail_w, top - bottom)[1] + p.getSpaceAfter()
+                for p in parts
+            )
+            if y - needed < bottom and y < top:
+                canv.showPage()
+                y, space_after = top, 0
+        pending = list(parts)
+        while pending:
+            part = pending.pop(0)
+            # Like Frame, the previous flowable's spaceAfter overlaps this one's spaceBefore
+            space = max(part.getSpaceBefore() - space_after, 0) if y < top else 0
+            w, h = part.wrapOn(canv, avail_w, y - bottom - space)
+            if y - space - h < bottom:
+                # Too tall for what is left: split it here as Frame does, else start a new page
+                pieces = part.splitOn(canv, avail_w, y - bottom - space)
+                if pieces:
+                    pending[:0] = pieces
+                elif y < top:
+                    canv.showPage()
+                    y, space_after = top, 0
+                    pending.insert(0, part)
+                else:
+                    raise LayoutError(
+                        f"Flowable {part.__class__.__name__} ({w}x{h} points) too large for page "
+                        f"({avail_w}x{top - bottom} points)."
+                    )
+                continue
+            y -= space + h
+            part.drawOn(canv, x, y, _sW=avail_w - w)
+            space_after = part.getSpaceAfter()
+            y -= space_after
+    canv.save()
+
+
+# Passed to the canvas / doc template directly: compressed page streams, deterministic output
+PDF_OPTIONS = {
+    "pageCompression": 1,
+    "invariant": 1,
+}
+
+
+def render_pdf(legacy: bool = False) -> bytes:
+    """Render the report in memory and return the PDF bytes (e.g. for an HTTP response)."""
+    # Imported here so loading the module stays cheap; only rendering needs them
+    from reportlab.pdfgen.canvas import Canvas
+    from reportlab.platypus import SimpleDocTemplate
+
+    buf = io.BytesIO()
+    story = build_story()
+    if legacy:
         doc = SimpleDocTemplate(
-            output_path,
+            buf,
             pagesize=PAGE_SIZE,
             leftMargin=MARGIN,
             rightMargin=MARGIN,
@@ -411,9 +779,25 @@ def build_pdf(output_path: str) -> int:
             bottomMargin=MARGIN,
             title=f"{PROJECT_TITLE} Report",
             author=AUTHOR,
+            # Quick page breaks (already ReportLab's default), stated explicitly
+            _pageBreakQuick=1,
+            **PDF_OPTIONS,
         )
-        story = build_story()
         doc.build(story)
+    else:
+        canv = Canvas(buf, pagesize=PAGE_SIZE, **PDF_OPTIONS)
+        canv.setTitle(f"{PROJECT_TITLE} Report")
+        canv.setAuthor(AUTHOR)
+        draw_story(canv, story)
+    return buf.getvalue()
+
+
+def build_pdf(output_path: str, legacy: bool = False) -> int:
+    try:
+        data = render_pdf(legacy=legacy)
+        # The document is rendered in memory; a buffered file writes it out in full
+        with open(output_path, "wb") as f:
+            f.write(data)
         return 0
     except Exception as e:
         print(f"Error generating PDF: {e}")
@@ -421,8 +805,18 @@ def build_pdf(output_path: str) -> int:
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the project PDF report.")
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="lay out through SimpleDocTemplate instead of drawing directly (for regression comparison)",
+    )
+    args = parser.parse_args()
+
     out = OUTPUT_PDF
-    rc = build_pdf(out)
+    rc = build_pdf(out, legacy=args.legacy)
     if rc == 0:
         print(f"PDF successfully created: {out}")
     else: